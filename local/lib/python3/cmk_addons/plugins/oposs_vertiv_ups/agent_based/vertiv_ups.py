@@ -8,7 +8,9 @@ Vertiv/Liebert UPS Monitoring Plugin
 SNMP section with metadata-driven OID management
 """
 
+import sys
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
 from cmk.agent_based.v2 import (
@@ -19,42 +21,68 @@ from cmk.agent_based.v2 import (
     contains,
 )
 
+try:
+    # Optional: C-level parser for short numeric strings, much faster than float()
+    from fastnumbers import try_float
+except ImportError:
+    _to_f = float
+else:
+    _to_f = partial(try_float, on_fail=0.0, on_type_error=0.0, allow_underscores=True)
+
 
 # ============================================================================
 # Unit Conversion Functions
 # ============================================================================
+# Every converter returns a default (0.0, 0, "" or "unknown") on bad input
+# instead of raising; parse_vertiv_ups relies on this and does not guard
+# converter calls.
 
 def to_float(value: str) -> float:
     """Convert string to float, return 0.0 on error"""
     try:
-        return float(value) if value else 0.0
+        return _to_f(value) if value else 0.0
     except (ValueError, TypeError):
         return 0.0
 
 
 def decivolts_to_volts(value: str) -> float:
     """Convert decivolts to volts (e.g., 1200 -> 120.0)"""
-    return to_float(value) / 10.0
+    try:
+        return _to_f(value) / 10.0 if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
 
 
 def centihertz_to_hertz(value: str) -> float:
     """Convert centihertz to hertz (e.g., 5000 -> 50.0)"""
-    return to_float(value) / 100.0
+    try:
+        return _to_f(value) / 100.0 if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
 
 
 def minutes_to_seconds(value: str) -> float:
     """Convert minutes to seconds"""
-    return to_float(value) * 60.0
+    try:
+        return _to_f(value) * 60.0 if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
 
 
 def decicelsius_to_celsius(value: str) -> float:
     """Convert decicelsius to celsius"""
-    return to_float(value) / 10.0
+    try:
+        return _to_f(value) / 10.0 if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
 
 
 def deciunits_to_units(value: str) -> float:
     """Convert deci-units to base units (divide by 10)"""
-    return to_float(value) / 10.0
+    try:
+        return _to_f(value) / 10.0 if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
 
 
 def to_string(value: str) -> str:
@@ -65,8 +93,9 @@ def to_string(value: str) -> str:
 def to_int(value: str) -> int:
     """Convert string to int, return 0 on error"""
     try:
-        return int(float(value)) if value else 0
-    except (ValueError, TypeError):
+        return int(_to_f(value)) if value else 0
+    except (ValueError, TypeError, OverflowError):
+        # OverflowError: "inf" or out-of-range values like "1e400"
         return 0
 
 
@@ -74,23 +103,35 @@ def to_int(value: str) -> int:
 # Value Mapping Dictionaries
 # ============================================================================
 
-SYSTEM_STATUS_MAP = {
-    # Numeric values (some Liebert models)
+# System status arrives either as a number (some Liebert models) or as a
+# string (Vertiv GXT5 and similar models). Each form has its own small map.
+_SYS_NUM = {
     "0": "unknown",
     "1": "startup",
     "2": "normal",
     "3": "on_battery",
     "4": "on_bypass",
     "5": "shutdown",
-    # String values (Vertiv GXT5 and similar models)
-    "Normal Operation": "normal",
-    "Startup": "startup",
-    "On Battery": "on_battery",
-    "On Bypass": "on_bypass",
-    "Shutdown": "shutdown",
-    "Unknown": "unknown",
 }
 
+_SYS_STR = {
+    sys.intern(status): mapped
+    for status, mapped in {
+        "Normal Operation": "normal",
+        "Startup": "startup",
+        "On Battery": "on_battery",
+        "On Bypass": "on_bypass",
+        "Shutdown": "shutdown",
+        "Unknown": "unknown",
+    }.items()
+}
+
+
+def map_system_status(value: str) -> str:
+    """Map numeric or string system status to its normalized name"""
+    return _SYS_NUM.get(value) or _SYS_STR.get(value, "unknown")
+
+
 BATTERY_STATUS_MAP = {
     "1": "unknown",
     "2": "normal",
@@ -159,7 +200,7 @@ OID_DEFINITIONS: List[OIDDefinition] = [
         "system_status", "4.1.476.1.42.3.9.20.1.20.1.2.1.4123",
         "System Status (Liebert)",
         "system_status",
-        mapper=SYSTEM_STATUS_MAP
+        converter=map_system_status
     ),
     OIDDefinition(
         "output_source", "4.1.476.1.42.3.9.20.1.20.1.2.1.4872",
@@ -455,6 +496,27 @@ OID_DEFINITIONS: List[OIDDefinition] = [
 ]
 
 
+# ============================================================================
+# Parse Tables (precomputed at import time)
+# ============================================================================
+
+# Column-oriented view of OID_DEFINITIONS, indexed by position in the SNMP row.
+# OIDDefinition is only a construction-time convenience; the parse function
+# works exclusively on these tuples.
+_FALLBACK_LOOKUP = {
+    d.fallback_for: idx for idx, d in enumerate(OID_DEFINITIONS) if d.fallback_for
+}
+
+_OIDS = tuple(d.oid for d in OID_DEFINITIONS)
+_OUTPUT_KEYS = tuple(d.output_key for d in OID_DEFINITIONS)
+_CONVERTERS = tuple(d.converter for d in OID_DEFINITIONS)
+_MAPPER_GETS = tuple(d.mapper.get if d.mapper else None for d in OID_DEFINITIONS)
+_FALLBACK_IDX = tuple(_FALLBACK_LOOKUP.get(d.key, -1) for d in OID_DEFINITIONS)
+_IS_FALLBACK = tuple(bool(d.fallback_for) for d in OID_DEFINITIONS)
+# Fallback OIDs are only read through their primary OID
+_PRIMARY_IDX = tuple(idx for idx, fallback in enumerate(_IS_FALLBACK) if not fallback)
+
+
 # ============================================================================
 # Parse Function
 # ============================================================================
@@ -463,7 +525,7 @@ def parse_vertiv_ups(string_table: List[List[str]]) -> Dict[str, Any]:
     """
     Parse SNMP data using OID metadata table.
 
-    Implements automatic fallback: if primary (Liebert) OID is empty/zero,
+    Implements automatic fallback: if primary (Liebert) OID is empty,
     tries the fallback (RFC1628) OID.
 
     Args:
@@ -475,56 +537,41 @@ def parse_vertiv_ups(string_table: List[List[str]]) -> Dict[str, Any]:
     if not string_table or not string_table[0]:
         return {}
 
-    # Map raw SNMP values to OID keys
-    raw_data: Dict[str, str] = {}
-    for idx, value in enumerate(string_table[0]):
-        if idx < len(OID_DEFINITIONS):
-            raw_data[OID_DEFINITIONS[idx].key] = value
+    # Pad a short row once so the loop can index without bounds checks
+    row = string_table[0]
+    if len(row) < len(_OIDS):
+        row = row + [""] * (len(_OIDS) - len(row))
+
+    output_keys = _OUTPUT_KEYS
+    converters = _CONVERTERS
+    mapper_gets = _MAPPER_GETS
+    fallback_idx = _FALLBACK_IDX
 
-    # Process with metadata and handle fallbacks
     parsed: Dict[str, Any] = {}
 
-    for oid_def in OID_DEFINITIONS:
-        value = raw_data.get(oid_def.key, "")
-
-        # Skip fallback OIDs - they'll be used if primary fails
-        if oid_def.fallback_for:
-            continue
-
-        # If primary value is missing (empty string), check for fallback
-        # Note: Zero is a valid value and should not trigger fallback
-        # CRITICAL FIX: Use explicit empty string check, not "not value"
-        # because "0" is falsy in Python but is a valid SNMP value
-        if value == "":
-            # Look for a fallback OID
-            fallback_oid = next(
-                (d for d in OID_DEFINITIONS if d.fallback_for == oid_def.key),
-                None
-            )
-            if fallback_oid:
-                value = raw_data.get(fallback_oid.key, "")
-
-        # Apply conversion or mapping if value exists
-        if value:
-            if oid_def.mapper:
-                parsed[oid_def.output_key] = oid_def.mapper.get(value, "unknown")
-            elif oid_def.converter:
-                try:
-                    parsed[oid_def.output_key] = oid_def.converter(value)
-                except (ValueError, TypeError):
-                    # Use appropriate default based on converter type
-                    if oid_def.converter in [to_float, decivolts_to_volts,
-                                            centihertz_to_hertz, minutes_to_seconds,
-                                            decicelsius_to_celsius, deciunits_to_units]:
-                        parsed[oid_def.output_key] = 0.0
-                    elif oid_def.converter == to_int:
-                        parsed[oid_def.output_key] = 0
-                    else:
-                        parsed[oid_def.output_key] = ""
-            else:
-                # CRITICAL FIX: Store raw value if no mapper or converter specified
-                # This prevents silent data loss
-                parsed[oid_def.output_key] = value
+    for idx in _PRIMARY_IDX:
+        # Only an empty primary value triggers the fallback: "0" is a valid
+        # SNMP value and must not be replaced
+        value = row[idx]
+        if not value:
+            fallback = fallback_idx[idx]
+            if fallback < 0:
+                continue
+            value = row[fallback]
+            if not value:
+                continue
+
+        mapper_get = mapper_gets[idx]
+        converter = converters[idx]
+        if mapper_get:
+            parsed[output_keys[idx]] = mapper_get(value, "unknown")
+        elif converter:
+            # Converters handle bad input themselves and return a default
+            parsed[output_keys[idx]] = converter(value)
+        else:
+            # Store raw value if no mapper or converter specified
+            # This prevents silent data loss
+            parsed[output_keys[idx]] = value
 
     return parsed
 
@@ -533,17 +580,20 @@ def parse_vertiv_ups(string_table: List[List[str]]) -> Dict[str, Any]:
 # SNMP Section Registration
 # ============================================================================
 
+# Built once at import and handed to the section as-is
+_DETECT = any_of(
+    # Liebert-GP Agent present
+    exists(".1.3.6.1.4.1.476.1.42.2.1.1.0"),
+    # Standard UPS MIB with Vertiv manufacturer
+    contains(".1.3.6.1.2.1.33.1.1.1.0", "Vertiv"),
+)
+
 snmp_section_vertiv_ups = SimpleSNMPSection(
     name="vertiv_ups",
     parse_function=parse_vertiv_ups,
     fetch=SNMPTree(
         base=".1.3.6.1",  # Base OID for all SNMP queries
-        oids=[oid_def.oid for oid_def in OID_DEFINITIONS],
-    ),
-    detect=any_of(
-        # Liebert-GP Agent present
-        exists(".1.3.6.1.4.1.476.1.42.2.1.1.0"),
-        # Standard UPS MIB with Vertiv manufacturer
-        contains(".1.3.6.1.2.1.33.1.1.1.0", "Vertiv"),
+        oids=_OIDS,
     ),
+    detect=_DETECT,
 )
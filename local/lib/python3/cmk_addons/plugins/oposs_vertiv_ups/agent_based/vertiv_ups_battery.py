@@ -8,7 +8,7 @@ Vertiv/Liebert UPS Battery Monitoring
 Monitors battery charge, temperature, runtime, voltage, and alarms
 """
 
-from typing import Any, Callable, Dict, List, Mapping, Tuple
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple, Union
 
 from cmk.agent_based.v2 import (
     CheckPlugin,
@@ -23,20 +23,35 @@ from cmk.agent_based.v2 import (
 )
 
 
+# ============================================================================
+# Render Functions and Informational Metrics
+# ============================================================================
+
+_fmt_volts_1 = "{:.1f} V".format
+_fmt_amps_1 = "{:.1f} A".format
+_fmt_celsius_1 = "{:.1f} °C".format
+
+# Informational metrics: (section_key, metric_name, label, render_func)
+_BATTERY_INFO_METRICS = (
+    ("battery_voltage", "battery_voltage", "Battery voltage", _fmt_volts_1),
+    ("battery_current", "battery_current", "Battery current", _fmt_amps_1),
+)
+
+
 # ============================================================================
 # Helper Functions (DRY improvements)
 # ============================================================================
 
-def yield_informational_metric(
+def informational_metric(
     section: Dict[str, Any],
     key: str,
     metric_name: str,
     label: str,
     render_func: Callable[[float], str],
     min_value: float = 0.0,
-) -> CheckResult:
+) -> Tuple[Union[Metric, Result], ...]:
     """
-    Yield metric and notice for informational values.
+    Build metric and notice for informational values.
 
     This helper eliminates repetitive code for simple metric reporting.
 
@@ -48,22 +63,26 @@ def yield_informational_metric(
         render_func: Function to format the value for display
         min_value: Minimum value to report (values <= this are skipped)
 
-    Yields:
-        Metric and Result objects
+    Returns:
+        Metric and Result objects, or an empty tuple if the value is skipped
     """
-    value = section.get(key)
-    if value is not None and value > min_value:
-        yield Metric(metric_name, value)
-        yield Result(
-            state=State.OK,
-            notice=f"{label}: {render_func(value)}"
+    # A missing value defaults to min_value and is skipped like one at min_value
+    value = section.get(key, min_value)
+    if value > min_value:
+        return (
+            Metric(metric_name, value),
+            Result(
+                state=State.OK,
+                notice=f"{label}: {render_func(value)}"
+            ),
         )
+    return ()
 
 
 def check_alarms(
     section: Dict[str, Any],
-    alarm_definitions: List[Tuple[str, State, str]]
-) -> CheckResult:
+    alarm_definitions: Sequence[Tuple[str, State, str]],
+) -> Tuple[Result, ...]:
     """
     Check multiple alarms using declarative definitions.
 
@@ -71,14 +90,22 @@ def check_alarms(
 
     Args:
         section: Parsed UPS data
-        alarm_definitions: List of (alarm_key, state, message) tuples
+        alarm_definitions: Sequence of (alarm_key, state, message) tuples
 
-    Yields:
+    Returns:
         Result objects for active alarms
     """
-    for alarm_key, alarm_state, alarm_message in alarm_definitions:
-        if section.get(alarm_key, 0) > 0:
-            yield Result(state=alarm_state, summary=alarm_message)
+    get = section.get
+
+    # Alarms are all clear on a healthy UPS; skip the per-alarm checks then
+    if not any(get(alarm_key) for alarm_key, _, _ in alarm_definitions):
+        return ()
+
+    return tuple(
+        Result(state=alarm_state, summary=alarm_message)
+        for alarm_key, alarm_state, alarm_message in alarm_definitions
+        if get(alarm_key, 0) > 0
+    )
 
 
 def discover_vertiv_ups_battery(section: Dict[str, Any]) -> DiscoveryResult:
@@ -95,6 +122,19 @@ def discover_vertiv_ups_battery(section: Dict[str, Any]) -> DiscoveryResult:
         yield Service()
 
 
+# Battery alarm definitions: (alarm_key, state, message)
+_BATTERY_ALARMS: Tuple[Tuple[str, State, str], ...] = (
+    ("alarm_battery_low", State.CRIT, "ALARM: Battery low!"),
+    ("alarm_battery_temp", State.CRIT, "ALARM: Battery temperature critical!"),
+    ("alarm_battery_discharging", State.WARN, "ALARM: Battery discharging!"),
+    ("alarm_replace_battery", State.WARN, "ALARM: Replace battery!"),
+)
+
+
+_RES_NO_DATA = Result(state=State.UNKNOWN, summary="No data from UPS")
+_RES_CHARGE_NA = Result(state=State.UNKNOWN, summary="Battery charge data unavailable")
+
+
 def check_vertiv_ups_battery(
     params: Mapping[str, Any],
     section: Dict[str, Any],
@@ -117,7 +157,7 @@ def check_vertiv_ups_battery(
         Result and Metric objects
     """
     if not section:
-        yield Result(state=State.UNKNOWN, summary="No data from UPS")
+        yield _RES_NO_DATA
         return
 
     # Check battery charge percentage
@@ -132,7 +172,7 @@ def check_vertiv_ups_battery(
             boundaries=(0, 100),
         )
     else:
-        yield Result(state=State.UNKNOWN, summary="Battery charge data unavailable")
+        yield _RES_CHARGE_NA
 
     # Check battery temperature
     battery_temp = section.get("battery_temperature")
@@ -142,7 +182,7 @@ def check_vertiv_ups_battery(
             levels_upper=params.get("battery_temperature_upper"),
             metric_name="battery_temperature",
             label="Battery temperature",
-            render_func=lambda t: f"{t:.1f} °C",
+            render_func=_fmt_celsius_1,
         )
 
     # Check battery runtime
@@ -156,17 +196,11 @@ def check_vertiv_ups_battery(
             render_func=render.timespan,
         )
 
-    # Battery voltage (informational)
-    yield from yield_informational_metric(
-        section, "battery_voltage", "battery_voltage",
-        "Battery voltage", lambda v: f"{v:.1f} V"
-    )
-
-    # Battery current (informational)
-    yield from yield_informational_metric(
-        section, "battery_current", "battery_current",
-        "Battery current", lambda a: f"{a:.1f} A"
-    )
+    # Battery voltage and current (informational)
+    for key, metric_name, label, render_func in _BATTERY_INFO_METRICS:
+        yield from informational_metric(
+            section, key, metric_name, label, render_func
+        )
 
     # Battery replacement date (informational)
     battery_replacement_date = section.get("battery_replacement_date")
@@ -177,13 +211,7 @@ def check_vertiv_ups_battery(
         )
 
     # Check battery alarms using declarative definitions
-    BATTERY_ALARMS = [
-        ("alarm_battery_low", State.CRIT, "ALARM: Battery low!"),
-        ("alarm_battery_temp", State.CRIT, "ALARM: Battery temperature critical!"),
-        ("alarm_battery_discharging", State.WARN, "ALARM: Battery discharging!"),
-        ("alarm_replace_battery", State.WARN, "ALARM: Replace battery!"),
-    ]
-    yield from check_alarms(section, BATTERY_ALARMS)
+    yield from check_alarms(section, _BATTERY_ALARMS)
 
 
 check_plugin_vertiv_ups_battery = CheckPlugin(
@@ -22,6 +22,9 @@ from cmk.agent_based.v2 import (
 )
 
 
+_fmt_celsius_1 = "{:.1f} °C".format
+
+
 def discover_vertiv_ups_environment(section: Dict[str, Any]) -> DiscoveryResult:
     """
     Discover environment service if environmental data is available.
@@ -38,6 +41,10 @@ def discover_vertiv_ups_environment(section: Dict[str, Any]) -> DiscoveryResult:
             yield Service()
 
 
+_RES_NO_DATA = Result(state=State.UNKNOWN, summary="No data from UPS")
+_RES_TEMP_NA = Result(state=State.UNKNOWN, summary="Ambient temperature data unavailable")
+
+
 def check_vertiv_ups_environment(
     params: Mapping[str, Any],
     section: Dict[str, Any],
@@ -56,7 +63,7 @@ def check_vertiv_ups_environment(
         Result and Metric objects
     """
     if not section:
-        yield Result(state=State.UNKNOWN, summary="No data from UPS")
+        yield _RES_NO_DATA
         return
 
     # Check ambient temperature
@@ -67,13 +74,10 @@ def check_vertiv_ups_environment(
             levels_upper=params.get("ambient_temperature_upper"),
             metric_name="ambient_temperature",
             label="Inlet air temperature",
-            render_func=lambda t: f"{t:.1f} °C",
+            render_func=_fmt_celsius_1,
         )
     else:
-        yield Result(
-            state=State.UNKNOWN,
-            summary="Ambient temperature data unavailable"
-        )
+        yield _RES_TEMP_NA
 
 
 check_plugin_vertiv_ups_environment = CheckPlugin(
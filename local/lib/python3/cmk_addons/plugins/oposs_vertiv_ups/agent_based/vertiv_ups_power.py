@@ -8,7 +8,7 @@ Vertiv/Liebert UPS Power Monitoring
 Monitors input/output power, voltage, current, frequency, and load
 """
 
-from typing import Any, Callable, Dict, List, Mapping, Tuple
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple
 
 from cmk.agent_based.v2 import (
     CheckPlugin,
@@ -24,46 +24,25 @@ from cmk.agent_based.v2 import (
 
 
 # ============================================================================
-# Helper Functions (DRY improvements)
+# Render Functions
 # ============================================================================
 
-def yield_informational_metric(
-    section: Dict[str, Any],
-    key: str,
-    metric_name: str,
-    label: str,
-    render_func: Callable[[float], str],
-    min_value: float = 0.0,
-) -> CheckResult:
-    """
-    Yield metric and notice for informational values.
-
-    This helper eliminates repetitive code for simple metric reporting.
-
-    Args:
-        section: Parsed UPS data
-        key: Key to look up in section
-        metric_name: Metric name for CheckMK
-        label: Human-readable label for the notice
-        render_func: Function to format the value for display
-        min_value: Minimum value to report (values <= this are skipped)
+_fmt_volts_1 = "{:.1f} V".format
+_fmt_amps_1 = "{:.1f} A".format
+_fmt_watts_0 = "{:.0f} W".format
+_fmt_va_0 = "{:.0f} VA".format
+_fmt_pf = "{:.2f}".format
+_fmt_hz_1 = "{:.1f} Hz".format
 
-    Yields:
-        Metric and Result objects
-    """
-    value = section.get(key)
-    if value is not None and value > min_value:
-        yield Metric(metric_name, value)
-        yield Result(
-            state=State.OK,
-            notice=f"{label}: {render_func(value)}"
-        )
 
+# ============================================================================
+# Helper Functions (DRY improvements)
+# ============================================================================
 
 def check_alarms(
     section: Dict[str, Any],
-    alarm_definitions: List[Tuple[str, State, str]]
-) -> CheckResult:
+    alarm_definitions: Sequence[Tuple[str, State, str]],
+) -> Tuple[Result, ...]:
     """
     Check multiple alarms using declarative definitions.
 
@@ -71,14 +50,22 @@ def check_alarms(
 
     Args:
         section: Parsed UPS data
-        alarm_definitions: List of (alarm_key, state, message) tuples
+        alarm_definitions: Sequence of (alarm_key, state, message) tuples
 
-    Yields:
+    Returns:
         Result objects for active alarms
     """
-    for alarm_key, alarm_state, alarm_message in alarm_definitions:
-        if section.get(alarm_key, 0) > 0:
-            yield Result(state=alarm_state, summary=alarm_message)
+    get = section.get
+
+    # Alarms are all clear on a healthy UPS; skip the per-alarm checks then
+    if not any(get(alarm_key) for alarm_key, _, _ in alarm_definitions):
+        return ()
+
+    return tuple(
+        Result(state=alarm_state, summary=alarm_message)
+        for alarm_key, alarm_state, alarm_message in alarm_definitions
+        if get(alarm_key, 0) > 0
+    )
 
 
 def discover_vertiv_ups_power(section: Dict[str, Any]) -> DiscoveryResult:
@@ -95,6 +82,47 @@ def discover_vertiv_ups_power(section: Dict[str, Any]) -> DiscoveryResult:
         yield Service()
 
 
+# System status -> (state, status text) for statuses that map directly
+_STATUS_MAP: Dict[str, Tuple[State, str]] = {
+    "normal": (State.OK, "normal"),
+    "on_bypass": (State.OK, "on bypass"),
+    "on_battery": (State.WARN, "on battery"),
+    "shutdown": (State.CRIT, "shutdown"),
+    "startup": (State.OK, "startup"),
+}
+
+# Informational metrics: (section_key, metric_name, label, render_func)
+# Reported only when the value is present and greater than zero
+_INPUT_INFO_METRICS: Tuple[Tuple[str, str, str, Callable[[float], str]], ...] = (
+    ("input_voltage", "input_voltage", "Input voltage", _fmt_volts_1),
+    ("input_voltage_max", "input_voltage_max", "Input voltage max", _fmt_volts_1),
+    ("input_voltage_min", "input_voltage_min", "Input voltage min", _fmt_volts_1),
+    ("input_current", "input_current", "Input current", _fmt_amps_1),
+    ("input_frequency", "input_frequency", "Input frequency", _fmt_hz_1),
+    ("input_power_factor", "input_power_factor", "Input power factor", _fmt_pf),
+)
+
+_OUTPUT_INFO_METRICS: Tuple[Tuple[str, str, str, Callable[[float], str]], ...] = (
+    ("output_apparent_power", "output_apparent_power", "Output apparent power", _fmt_va_0),
+    ("output_power_factor", "output_power_factor", "Output power factor", _fmt_pf),
+    ("output_apparent_power_rating", "output_apparent_power_rating", "Rated power", _fmt_va_0),
+)
+
+# Power alarm definitions: (alarm_key, state, message)
+_POWER_ALARMS: Tuple[Tuple[str, State, str], ...] = (
+    ("alarm_input_problem", State.WARN, "ALARM: Input power problem detected!"),
+    ("alarm_overload", State.CRIT, "ALARM: Output overload!"),
+    ("alarm_bypass_not_available", State.WARN, "ALARM: Bypass not available!"),
+    ("alarm_output_off", State.CRIT, "ALARM: System output off!"),
+    ("alarm_inverter_failure", State.CRIT, "ALARM: Inverter failure!"),
+)
+
+
+# Fixed results, built once at import (Result is immutable)
+_RES_NO_DATA = Result(state=State.UNKNOWN, summary="No data from UPS")
+_RES_LOAD_NA = Result(state=State.UNKNOWN, notice="Output load data unavailable")
+
+
 def check_vertiv_ups_power(
     params: Mapping[str, Any],
     section: Dict[str, Any],
@@ -117,32 +145,24 @@ def check_vertiv_ups_power(
         Result and Metric objects
     """
     if not section:
-        yield Result(state=State.UNKNOWN, summary="No data from UPS")
+        yield _RES_NO_DATA
         return
 
+    sget = section.get
+
     # System status - use output_source as fallback for more reliable detection
-    system_status = section.get("system_status", "unknown")
-    output_source = section.get("output_source", "")
+    system_status = sget("system_status", "unknown")
+    output_source = sget("output_source", "")
 
     # Determine actual operational state
     # ECO mode (bypass) is normal operation, not a warning condition
-    if system_status == "normal":
-        status_state = State.OK
-        status_text = "normal"
-    elif system_status == "on_bypass" or output_source == "bypass":
+    mapped_status = _STATUS_MAP.get(system_status)
+    if output_source == "bypass" and system_status != "normal":
         # Bypass/ECO mode is normal operation for efficiency
-        status_state = State.OK
-        status_text = "bypass (ECO mode)" if output_source == "bypass" else "on bypass"
-    elif system_status == "on_battery":
-        status_state = State.WARN
-        status_text = "on battery"
-    elif system_status in ["shutdown"]:
-        status_state = State.CRIT
-        status_text = system_status
-    elif system_status == "startup":
-        status_state = State.OK
-        status_text = "startup"
-    elif system_status == "unknown" and output_source in ["normal", "bypass"]:
+        status_state, status_text = State.OK, "bypass (ECO mode)"
+    elif mapped_status:
+        status_state, status_text = mapped_status
+    elif system_status == "unknown" and output_source in ("normal", "bypass"):
         # If system_status is unknown but output_source indicates normal operation
         status_state = State.OK
         status_text = f"operating ({output_source} mode)"
@@ -157,16 +177,18 @@ def check_vertiv_ups_power(
     )
 
     # ECO mode information (already shown in status, provide as detail)
-    eco_state = section.get("eco_mode_state", 0)
-    eco_status = section.get("eco_mode_status", 0)
-    if output_source == "bypass" and (eco_state > 0 or eco_status > 0):
-        yield Result(
-            state=State.OK,
-            notice="ECO mode enabled for energy efficiency"
-        )
+    # ECO mode only matters while running on bypass
+    if output_source == "bypass":
+        eco_state = sget("eco_mode_state", 0)
+        eco_status = sget("eco_mode_status", 0)
+        if eco_state > 0 or eco_status > 0:
+            yield Result(
+                state=State.OK,
+                notice="ECO mode enabled for energy efficiency"
+            )
 
     # Output load percentage (critical metric)
-    output_load = section.get("output_load")
+    output_load = sget("output_load")
     if output_load is not None:
         yield from check_levels(
             output_load,
@@ -177,72 +199,48 @@ def check_vertiv_ups_power(
             boundaries=(0, 100),
         )
     else:
-        yield Result(state=State.UNKNOWN, notice="Output load data unavailable")
+        yield _RES_LOAD_NA
 
     # Output power (watts)
-    yield from yield_informational_metric(
-        section, "output_power", "output_power",
-        "Output power", lambda w: f"{w:.0f} W"
-    )
+    if (output_power := sget("output_power", 0)) > 0:
+        yield Metric("output_power", output_power)
+        yield Result(state=State.OK, notice=f"Output power: {_fmt_watts_0(output_power)}")
 
     # Output voltage
-    output_voltage = section.get("output_voltage")
-    if output_voltage is not None and output_voltage > 0:
+    if (output_voltage := sget("output_voltage", 0)) > 0:
         yield from check_levels(
             output_voltage,
             levels_upper=params.get("output_voltage_upper"),
             levels_lower=params.get("output_voltage_lower"),
             metric_name="output_voltage",
             label="Output voltage",
-            render_func=lambda v: f"{v:.1f} V",
+            render_func=_fmt_volts_1,
         )
 
     # Output current
-    yield from yield_informational_metric(
-        section, "output_current", "output_current",
-        "Output current", lambda a: f"{a:.1f} A"
-    )
+    if (output_current := sget("output_current", 0)) > 0:
+        yield Metric("output_current", output_current)
+        yield Result(state=State.OK, notice=f"Output current: {_fmt_amps_1(output_current)}")
 
     # Output frequency
-    output_frequency = section.get("output_frequency")
-    if output_frequency is not None and output_frequency > 0:
+    if (output_frequency := sget("output_frequency", 0)) > 0:
         yield from check_levels(
             output_frequency,
             levels_upper=params.get("output_frequency_upper"),
             levels_lower=params.get("output_frequency_lower"),
             metric_name="output_frequency",
             label="Output frequency",
-            render_func=lambda f: f"{f:.1f} Hz",
+            render_func=_fmt_hz_1,
         )
 
-    # Input metrics
-    yield from yield_informational_metric(
-        section, "input_voltage", "input_voltage",
-        "Input voltage", lambda v: f"{v:.1f} V"
-    )
-    yield from yield_informational_metric(
-        section, "input_voltage_max", "input_voltage_max",
-        "Input voltage max", lambda v: f"{v:.1f} V"
-    )
-    yield from yield_informational_metric(
-        section, "input_voltage_min", "input_voltage_min",
-        "Input voltage min", lambda v: f"{v:.1f} V"
-    )
-    yield from yield_informational_metric(
-        section, "input_current", "input_current",
-        "Input current", lambda a: f"{a:.1f} A"
-    )
-    yield from yield_informational_metric(
-        section, "input_frequency", "input_frequency",
-        "Input frequency", lambda f: f"{f:.1f} Hz"
-    )
-    yield from yield_informational_metric(
-        section, "input_power_factor", "input_power_factor",
-        "Input power factor", lambda pf: f"{pf:.2f}"
-    )
+    # Input metrics (missing and zero values are both skipped)
+    for key, metric_name, label, render_func in _INPUT_INFO_METRICS:
+        if (value := sget(key, 0)) > 0:
+            yield Metric(metric_name, value)
+            yield Result(state=State.OK, notice=f"{label}: {render_func(value)}")
 
     # Input blackout count (special handling - allow zero)
-    blackout_count = section.get("input_blackout_count")
+    blackout_count = sget("input_blackout_count")
     if blackout_count is not None:
         yield Metric("input_blackout_count", blackout_count)
         if blackout_count > 0:
@@ -252,28 +250,13 @@ def check_vertiv_ups_power(
             )
 
     # Output power metrics
-    yield from yield_informational_metric(
-        section, "output_apparent_power", "output_apparent_power",
-        "Output apparent power", lambda va: f"{va:.0f} VA"
-    )
-    yield from yield_informational_metric(
-        section, "output_power_factor", "output_power_factor",
-        "Output power factor", lambda pf: f"{pf:.2f}"
-    )
-    yield from yield_informational_metric(
-        section, "output_apparent_power_rating", "output_apparent_power_rating",
-        "Rated power", lambda va: f"{va:.0f} VA"
-    )
+    for key, metric_name, label, render_func in _OUTPUT_INFO_METRICS:
+        if (value := sget(key, 0)) > 0:
+            yield Metric(metric_name, value)
+            yield Result(state=State.OK, notice=f"{label}: {render_func(value)}")
 
     # Check power alarms using declarative definitions
-    POWER_ALARMS = [
-        ("alarm_input_problem", State.WARN, "ALARM: Input power problem detected!"),
-        ("alarm_overload", State.CRIT, "ALARM: Output overload!"),
-        ("alarm_bypass_not_available", State.WARN, "ALARM: Bypass not available!"),
-        ("alarm_output_off", State.CRIT, "ALARM: System output off!"),
-        ("alarm_inverter_failure", State.CRIT, "ALARM: Inverter failure!"),
-    ]
-    yield from check_alarms(section, POWER_ALARMS)
+    yield from check_alarms(section, _POWER_ALARMS)
 
 
 check_plugin_vertiv_ups_power = CheckPlugin(